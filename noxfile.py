@@ -1,11 +1,65 @@
 """Nox sessions."""
-import tempfile
+
+import hashlib
+import os
+from pathlib import Path
 
 import nox  # type: ignore
 
 nox.options.sessions = "lint", "test", "type_check"
-locations = "src", "tests", "noxfile.py", "docs/conf.py"
+locations = "src", "tests", "scripts", "noxfile.py", "docs/conf.py"
 supported_python_versions = "3.7", "3.8", "3.9", "3.10", "3.11"
+poetry_export_cache = Path(".nox", ".poetry-export-cache")
+
+
+def dependency_hash(*args):
+    """
+    Return hash of the project's dependency specification.
+
+    Args:
+        *args: Additional command-line arguments to include in the hash.
+
+    Returns:
+        Hex digest of pyproject.toml, poetry.lock, and the given arguments.
+    """
+    key = hashlib.sha256()
+    for path in ("pyproject.toml", "poetry.lock"):
+        key.update(Path(path).read_bytes())
+    key.update(" ".join(args).encode())
+    return key.hexdigest()
+
+
+def export_requirements(session, *args):
+    """
+    Export Poetry's lock file to a pip requirements file.
+
+    The exported file is cached under .nox/ and keyed by the content hash of
+    pyproject.toml and poetry.lock together with the given export arguments, so
+    ``poetry export`` only runs once per dependency specification.
+
+    Args:
+        session: The Session object.
+        *args: Command-line arguments for poetry export.
+
+    Returns:
+        Path to the exported requirements file.
+    """
+    requirements = poetry_export_cache / f"requirements-{dependency_hash(*args)}.txt"
+    if not requirements.exists():
+        # Sessions may run concurrently, see scripts/run_nox_parallel.py, so we
+        # export to a session-specific file which is atomically moved in place.
+        poetry_export_cache.mkdir(parents=True, exist_ok=True)
+        partial = requirements.with_name(f"{requirements.name}.{os.getpid()}")
+        session.run(
+            "poetry",
+            "export",
+            "--without-hashes",
+            *args,
+            f"--output={partial}",
+            external=True,
+        )
+        partial.replace(requirements)
+    return requirements
 
 
 def install_with_constraints(session, *args, **kwargs):
@@ -19,53 +73,57 @@ def install_with_constraints(session, *args, **kwargs):
     versions specified in poetry.lock. This allows you to manage the
     packages as Poetry development dependencies.
 
+    Sessions reuse their virtualenv, and a marker file is written to it after a
+    successful install. The install is skipped when the marker already exists,
+    i.e. when neither the arguments nor the dependency specification changed.
+
     Args:
         session: The Session object.
         *args: Command-line arguments for pip.
         **kwargs: Additional keyword arguments for Session.install.
     """
-    with tempfile.NamedTemporaryFile() as requirements:
-        session.run(
-            "poetry",
-            "export",
-            "--without-hashes",
-            "--with=dev",
-            "--format=constraints.txt",
-            f"--output={requirements.name}",
-            external=True,
-        )
-        session.install(f"--constraint={requirements.name}", *args, **kwargs)
+    marker = Path(session.virtualenv.location) / f".installed-{dependency_hash(*args)}"
+    if marker.exists():
+        session.log(f"Skipping unchanged install of {' '.join(args)}")
+        return
+    constraints = export_requirements(session, "--with=dev", "--format=constraints.txt")
+    session.install(f"--constraint={constraints}", *args, **kwargs)
+    marker.touch()
 
 
-@nox.session(python=supported_python_versions)
+@nox.session(python=supported_python_versions, reuse_venv=True)
 def test(session):
-    """Run test suite using pytest + coverage + xdoctest."""
+    """Run test suite in parallel using pytest + coverage + xdoctest."""
     if session.python == "3.9":
         # Only run test coverage and docstring tests on python 3.10
-        args = session.posargs or ["--cov", "--xdoctest"]
+        args = session.posargs or ["-n", "auto", "--cov", "--xdoctest"]
     else:
-        args = session.posargs
+        args = session.posargs or ["-n", "auto"]
 
-    session.run(
-        "poetry",
-        "install",
+    # The locked main dependencies are installed with plain pip instead of
+    # poetry install, which avoids running Poetry's dependency resolver.
+    # Environment markers in the export skip pandas on python 3.7.
+    requirements = export_requirements(
+        session,
         "--only=main",
-        "--extras",
-        # Pandas requires python version >= 3.8
-        "duckdb" if session.python == "3.7" else "duckdb pandas",
-        external=True,
+        "--extras=duckdb",
+        "--extras=pandas",
+        "--format=requirements.txt",
     )
     install_with_constraints(
         session,
+        f"--requirement={requirements}",
         "coverage[toml]",
         "pytest",
         "pytest-cov",
+        "pytest-xdist",
         "xdoctest",
     )
+    install_with_constraints(session, "--no-deps", "--editable", ".")
     session.run("pytest", *args)
 
 
-@nox.session(python="3.9")
+@nox.session(python="3.9", reuse_venv=True)
 def coverage(session):
     """Upload coverage data."""
     install_with_constraints(session, "coverage[toml]", "codecov")
@@ -73,7 +131,7 @@ def coverage(session):
     session.run("codecov", *session.posargs)
 
 
-@nox.session(python=["3.11"])
+@nox.session(python=["3.11"], reuse_venv=True)
 def type_check(session):
     """Run type-checking on project using pyright."""
     args = session.posargs or locations
@@ -92,34 +150,25 @@ def type_check(session):
     session.run("mypy", *args)
 
 
-@nox.session(python=["3.9"])
+@nox.session(python=["3.9"], reuse_venv=True)
 def lint(session):
-    """Run linters an project using flake8++."""
+    """Run linters on project using ruff."""
     args = session.posargs or locations
-    install_with_constraints(
-        session,
-        "flake8",
-        "flake8-annotations",
-        "flake8-bandit",
-        "flake8-black",
-        "flake8-bugbear",
-        "flake8-docstrings",
-        "flake8-isort",
-        "darglint",
-    )
-    session.run("flake8", *args)
+    install_with_constraints(session, "ruff")
+    session.run("ruff", "check", *args)
+    session.run("ruff", "format", "--check", *args)
 
 
-@nox.session(python="3.9")
+@nox.session(python="3.9", reuse_venv=True)
 def format(session):
-    """Run the black formatter on the entire code base."""
+    """Run the ruff formatter on the entire code base."""
     args = session.posargs or locations
-    install_with_constraints(session, "black", "isort")
-    session.run("black", *args)
-    session.run("isort", *args)
+    install_with_constraints(session, "ruff")
+    session.run("ruff", "check", "--select=I", "--fix", *args)
+    session.run("ruff", "format", *args)
 
 
-@nox.session(python="3.9")
+@nox.session(python="3.9", reuse_venv=True)
 def docs(session) -> None:
     """Build the documentation."""
     session.run(
@@ -0,0 +1,79 @@
+"""
+Run nox sessions concurrently, one nox subprocess per session.
+
+Nox executes the selected sessions one after another. The sessions in this
+project share no state, so they can just as well run side by side, bringing the
+wall time of a full run down to that of the slowest session. Parametrized
+sessions, such as ``test``, are fanned out into one subprocess per Python
+version.
+
+The output of each session is written to ``.nox/logs/<session>.log`` instead of
+the terminal, in order to avoid interleaved output. The script exits with a
+non-zero status code if any of the sessions fail.
+
+Usage:
+    python scripts/run_nox_parallel.py  # The default sessions of noxfile.py
+    python scripts/run_nox_parallel.py lint test  # Only the given sessions
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+LOG_DIRECTORY = Path(".nox", "logs")
+
+
+def selected_sessions(names: Sequence[str]) -> List[str]:
+    """
+    Return the concrete nox sessions selected by the given session names.
+
+    Args:
+        names: Session names as accepted by ``nox --sessions``. If empty, the
+            default sessions specified in ``noxfile.py`` are used.
+
+    Returns:
+        List of session identifiers, such as ``["lint", "test-3.9"]``.
+    """
+    command = ["nox", "--list", "--json"]
+    if names:
+        command += ["--sessions", *names]
+    output = subprocess.run(command, check=True, capture_output=True, text=True)
+    return [session["session"] for session in json.loads(output.stdout)]
+
+
+def main(argv: Sequence[str]) -> int:
+    """
+    Run the given nox sessions in parallel and wait for all of them to finish.
+
+    Args:
+        argv: Session names to run, see :func:`selected_sessions`.
+
+    Returns:
+        Zero if all sessions succeeded, otherwise one.
+    """
+    LOG_DIRECTORY.mkdir(parents=True, exist_ok=True)
+    processes: Dict[str, subprocess.Popen] = {}
+    for session in selected_sessions(argv):
+        log_path = LOG_DIRECTORY / f"{session}.log"
+        with log_path.open("w") as log_file:
+            processes[session] = subprocess.Popen(
+                ["nox", "--sessions", session],
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
+        print(f"Started nox session {session}, logging to {log_path}")
+
+    failed = []
+    for session, process in processes.items():
+        if process.wait() == 0:
+            print(f"Session {session} was successful.")
+        else:
+            print(f"Session {session} failed, see {LOG_DIRECTORY / session}.log")
+            failed.append(session)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
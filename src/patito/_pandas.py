@@ -0,0 +1,30 @@
+"""
+Lazy access to the optional pandas dependency.
+
+Importing pandas takes several hundred milliseconds, more than the rest of patito
+combined, so it should only be imported when actually used. An object can only be
+a pandas object if pandas has already been imported by someone else, which lets us
+check for pandas types without importing pandas ourselves.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+from typing_extensions import TypeGuard
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def is_pandas_dataframe(obj: object) -> TypeGuard[pd.DataFrame]:
+    """Return ``True`` if the given object is a pandas DataFrame."""
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(obj, pandas.DataFrame)
+
+
+def is_pandas_series(obj: object) -> TypeGuard[pd.Series]:
+    """Return ``True`` if the given object is a pandas Series."""
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(obj, pandas.Series)
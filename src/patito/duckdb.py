@@ -1,6 +1,7 @@
 """
 Module which wraps around the duckdb module in an opiniated manner.
 """
+
 from __future__ import annotations
 
 import hashlib
@@ -28,19 +29,14 @@ from pydantic import create_model
 from typing_extensions import Literal
 
 from patito import sql
+from patito._pandas import is_pandas_dataframe
 from patito.exceptions import MultipleRowsReturned, RowDoesNotExist
 from patito.polars import DataFrame
 from patito.pydantic import Model, ModelType
 
-try:
-    import pandas as pd
-
-    _PANDAS_AVAILABLE = True
-except ImportError:
-    _PANDAS_AVAILABLE = False
-
 if TYPE_CHECKING:
     import duckdb
+    import pandas as pd
 
 
 # Types which can be used to instantiate a DuckDB Relation object
@@ -115,7 +111,7 @@ def _enum_type_name(field_properties: dict) -> str:
     The same enum values, regardless of ordering, will always be given the same name.
     """
     enum_values = ", ".join(repr(value) for value in sorted(field_properties["enum"]))
-    value_hash = hashlib.md5(enum_values.encode("utf-8")).hexdigest()  # noqa: #S303
+    value_hash = hashlib.md5(enum_values.encode("utf-8")).hexdigest()  # noqa: S324
     return f"enum__{value_hash}"
 
 
@@ -250,7 +246,7 @@ class Relation(Generic[ModelType]):
             relation = derived_from
         elif isinstance(derived_from, str):
             relation = self.database.connection.from_query(derived_from)
-        elif _PANDAS_AVAILABLE and isinstance(derived_from, pd.DataFrame):
+        elif is_pandas_dataframe(derived_from):
             # We must replace pd.NA with np.nan in order for it to be considered
             # as null by DuckDB. Otherwise it will casted to the string <NA>
             # or even segfault.
@@ -1686,7 +1682,7 @@ class Relation(Generic[ModelType]):
             schema_change=False,
         )
 
-    def set_model(self, model):  # type: ignore[no-untyped-def] # noqa: ANN
+    def set_model(self, model):  # type: ignore[no-untyped-def] # noqa: ANN001, ANN201
         """
         Associate a give Patito model with the relation.
 
@@ -1,4 +1,5 @@
 """Logic related to the wrapping of the polars data frame library."""
+
 from __future__ import annotations
 
 from typing import (
@@ -164,11 +165,11 @@ class DataFrame(pl.DataFrame, Generic[ModelType]):
         Returns:
             A new LazyFrame object.
         """
-        lazyframe_class: LazyFrame[
-            ModelType
-        ] = LazyFrame._construct_lazyframe_model_class(
-            model=getattr(self, "model", None)
-        )  # type: ignore
+        lazyframe_class: Type[LazyFrame[ModelType]] = (
+            LazyFrame._construct_lazyframe_model_class(
+                model=getattr(self, "model", None)
+            )
+        )
         ldf = lazyframe_class._from_pyldf(super().lazy()._ldf)
         return ldf
 
@@ -442,7 +443,7 @@ class DataFrame(pl.DataFrame, Generic[ModelType]):
 
     def fill_null(
         self: DF,
-        value: Optional[Any] = None,
+        value: Optional[Any] = None,  # noqa: ANN401
         strategy: Optional[
             Literal[
                 "forward", "backward", "min", "max", "mean", "zero", "one", "defaults"
@@ -1,4 +1,5 @@
 """Logic related to wrapping logic around the pydantic library."""
+
 from __future__ import annotations
 
 import itertools
@@ -24,17 +25,13 @@ from pydantic import BaseConfig, BaseModel, Field, create_model  # noqa: F401
 from pydantic.main import ModelMetaclass as PydanticModelMetaclass
 from typing_extensions import Literal, get_args
 
+from patito._pandas import is_pandas_dataframe, is_pandas_series
 from patito.polars import DataFrame, LazyFrame
 from patito.validators import validate
 
-try:
+if TYPE_CHECKING:
     import pandas as pd
 
-    _PANDAS_AVAILABLE = True
-except ImportError:
-    _PANDAS_AVAILABLE = False
-
-if TYPE_CHECKING:
     import patito.polars
     from patito.duckdb import DuckDBSQLType
 
@@ -599,10 +596,10 @@ class Model(BaseModel, metaclass=ModelMetaclass):
         """
         if isinstance(row, pl.DataFrame):
             dataframe = row
-        elif _PANDAS_AVAILABLE and isinstance(row, pd.DataFrame):
+        elif is_pandas_dataframe(row):
             dataframe = pl.DataFrame._from_pandas(row)
-        elif _PANDAS_AVAILABLE and isinstance(row, pd.Series):  # type: ignore[unreachable]
-            return cls(**dict(row.items()))  # type: ignore[unreachable]
+        elif is_pandas_series(row):
+            return cls(**dict(row.items()))  # type: ignore[arg-type]
         else:
             raise TypeError(f"{cls.__name__}.from_row not implemented for {type(row)}.")
         return cls._from_polars(dataframe=dataframe, validate=validate)
@@ -915,9 +912,8 @@ class Model(BaseModel, metaclass=ModelMetaclass):
             0          -1  product A              dry
             1          -1  product B              dry
         """
-        if not _PANDAS_AVAILABLE:
-            # Re-trigger the import error, but this time don't catch it
-            raise ImportError("No module named 'pandas'")
+        # Raises ImportError if the optional pandas dependency is not installed
+        import pandas as pd
 
         if not isinstance(data, dict):
             if columns is None:
@@ -1,4 +1,5 @@
 """Module containing SQL generation utilities."""
+
 from typing import Dict, Optional, Union
 
 from typing_extensions import TypeAlias
@@ -1,4 +1,5 @@
 """Module for validating datastructures with respect to model specifications."""
+
 from __future__ import annotations
 
 import sys
@@ -7,6 +8,7 @@ from typing import TYPE_CHECKING, Type, Union, cast
 import polars as pl
 from typing_extensions import get_args, get_origin
 
+from patito._pandas import is_pandas_dataframe
 from patito.exceptions import (
     ColumnDTypeError,
     ErrorWrapper,
@@ -24,14 +26,9 @@ if sys.version_info >= (3, 10):  # pragma: no cover
 else:
     UNION_TYPES = (Union,)
 
-try:
+if TYPE_CHECKING:
     import pandas as pd
 
-    _PANDAS_AVAILABLE = True
-except ImportError:
-    _PANDAS_AVAILABLE = False
-
-if TYPE_CHECKING:
     from patito import Model
 
 
@@ -308,7 +305,7 @@ def validate(
     Raises:
         ValidationError: If the given dataframe does not match the given schema.
     """
-    if _PANDAS_AVAILABLE and isinstance(dataframe, pd.DataFrame):
+    if is_pandas_dataframe(dataframe):
         polars_dataframe = pl.from_pandas(dataframe)
     else:
         polars_dataframe = cast(pl.DataFrame, dataframe)
@@ -1,4 +1,5 @@
 """Tests for patito.Database."""
+
 import enum
 from typing import Optional
 
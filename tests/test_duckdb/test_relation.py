@@ -1,8 +1,9 @@
+import itertools
 import re
+import uuid
 from datetime import date, timedelta
 from pathlib import Path
-from typing import Optional
-from unittest.mock import MagicMock
+from typing import Optional, Sequence, Tuple
 
 import polars as pl
 import pytest
@@ -15,82 +16,182 @@ if not pt._DUCKDB_AVAILABLE:
     pytest.skip("DuckDB not installed", allow_module_level=True)
 
 
-def test_relation():
-    """Test functionality of Relation class."""
-    # Create a new in-memory database with dummy data
-    db = pt.Database()
-    table_df = pl.DataFrame(
+@pytest.fixture(scope="module")
+def db() -> pt.Database:
+    """Return an in-memory database shared by all tests in this module."""
+    # The test data is tiny and xdist already runs one worker per core, so a single
+    # DuckDB thread and a small memory budget avoids oversubscribing the machine.
+    database = pt.Database(config={"threads": 1, "memory_limit": "256MB"})
+
+    # Disable features which add per-query bookkeeping we don't need in the tests.
+    # Insertion order must be preserved, as the tests compare rows by position.
+    database.execute("PRAGMA disable_object_cache")
+    database.execute("PRAGMA disable_progress_bar")
+    database.execute("PRAGMA disable_profiling")
+    return database
+
+
+def unique_name(prefix: str) -> str:
+    """Return a table name which is not used by any other test on the shared db."""
+    return f"{prefix}_{uuid.uuid4().hex}"
+
+
+_view_names = (f"assert_equal_view_{index}" for index in itertools.count())
+
+
+def _create_views(*relations: pt.Relation) -> Tuple[str, ...]:
+    """Create uniquely named views of the given relations and return the names."""
+    names = tuple(next(_view_names) for _ in relations)
+    for name, relation in zip(names, relations):
+        relation.create_view(name)
+    return names
+
+
+def assert_all_equal(
+    db: pt.Database,
+    pairs: Sequence[Tuple[pt.Relation, object]],
+) -> None:
+    """
+    Assert that each relation is equal to the data source it is paired with.
+
+    Equivalent to ``assert relation == other`` for each pair, but the rows of all
+    pairs are compared with one query instead of iterating over each relation.
+    Rows are compared by their position, and the column names and types must match,
+    as ``except all`` would otherwise implicitly cast between differing types.
+    """
+    row_diffs = []
+    for relation, other in pairs:
+        other_relation = db.to_relation(other)
+        assert relation.columns == other_relation.columns
+        assert relation.types == other_relation.types
+        left, right = (
+            f"(select row_number() over () as row_number, * from {view})"
+            for view in _create_views(relation, other_relation)
+        )
+        row_diffs.append(
+            f"""
+            (select count(*) from (
+                (select * from {left} except all select * from {right})
+                union all
+                (select * from {right} except all select * from {left})
+            ))
+            """
+        )
+    sql = f"select {', '.join(row_diffs)}"
+    diff_counts = db.connection.execute(sql).fetchone()
+    assert diff_counts == (0,) * len(pairs)
+
+
+@pytest.fixture(scope="module")
+def table_df() -> pl.DataFrame:
+    """Return dummy data used by the Relation tests."""
+    return pl.DataFrame(
         {
             "column_1": [1, 2, 3],
             "column_2": ["a", "b", "c"],
         }
     )
-    db.to_relation(table_df).create_table(name="table_name")
-    table_relation = db.table("table_name")
 
-    # A projection can be done in several different ways
-    assert table_relation.select("column_1", "column_2") == table_relation.select(
-        "column_1, column_2"
-    )
-    assert (
-        table_relation.select("column_1, column_2")
-        == table_relation[["column_1, column_2"]]
-    )
-    assert table_relation[["column_1, column_2"]] == table_relation
-    assert table_relation.select("column_1") != table_relation.select("column_2")
 
-    # We can also use kewyrod arguments to rename columns
-    assert tuple(table_relation.select(column_3="column_1::varchar || column_2")) == (
-        {"column_3": "1a"},
-        {"column_3": "2b"},
-        {"column_3": "3c"},
+@pytest.fixture(scope="module")
+def table_relation(db, table_df) -> pt.Relation:
+    """Return relation pointing to a database table containing the dummy data."""
+    table_name = unique_name("table_name")
+    db.to_relation(table_df).create_table(name=table_name)
+    return db.table(table_name)
+
+
+def test_relation_projection(db, table_relation):
+    """A projection can be done in several different ways."""
+    assert_all_equal(
+        db,
+        [
+            (
+                table_relation.select("column_1", "column_2"),
+                table_relation.select("column_1, column_2"),
+            ),
+            (
+                table_relation.select("column_1, column_2"),
+                table_relation[["column_1, column_2"]],
+            ),
+            (table_relation[["column_1, column_2"]], table_relation),
+            # We can also use kewyrod arguments to rename columns
+            (
+                table_relation.select(column_3="column_1::varchar || column_2"),
+                pl.DataFrame({"column_3": ["1a", "2b", "3c"]}),
+            ),
+            # You should be able to subscript columns
+            (table_relation["column_1"], table_relation.select("column_1")),
+            (table_relation[["column_1", "column_2"]], table_relation),
+        ],
     )
+    assert table_relation.select("column_1") != table_relation.select("column_2")
 
-    # The .get() method should only work if the filter matches a single row
-    assert table_relation.get(column_1=1).column_2 == "a"
-
-    # But raise if not exactly one matching row is found
-    with pytest.raises(RuntimeError, match="Relation.get(.*) returned 0 rows!"):
-        assert table_relation.get("column_1 = 4")
-    with pytest.raises(RuntimeError, match="Relation.get(.*) returned 2 rows!"):
-        assert table_relation.get("column_1 > 1")
-
-    # The .get() should also accept a positional string
-    assert table_relation.get("column_1 < 2").column_2 == "a"
 
-    # And several positional strings
-    assert table_relation.get("column_1 > 1", "column_1 < 3").column_2 == "b"
+@pytest.mark.parametrize(
+    "args, kwargs, column_2",
+    [
+        # The .get() method should work if the filter matches a single row
+        ((), {"column_1": 1}, "a"),
+        # The .get() should also accept a positional string
+        (("column_1 < 2",), {}, "a"),
+        # And several positional strings
+        (("column_1 > 1", "column_1 < 3"), {}, "b"),
+        # And a mix of positional and keyword arguments
+        (("column_1 < 2",), {"column_2": "a"}, "a"),
+    ],
+)
+def test_relation_get(table_relation, args, kwargs, column_2):
+    """Relation.get() should return the single row matching the filters."""
+    assert table_relation.get(*args, **kwargs).column_2 == column_2
+
+
+@pytest.mark.parametrize(
+    "condition, row_count",
+    [("column_1 = 4", 0), ("column_1 > 1", 2)],
+)
+def test_relation_get_requires_single_row(table_relation, condition, row_count):
+    """Relation.get() should raise if not exactly one matching row is found."""
+    with pytest.raises(
+        RuntimeError, match=f"Relation.get(.*) returned {row_count} rows!"
+    ):
+        assert table_relation.get(condition)
 
-    # And a mix of positional and keyword arguments
-    assert table_relation.get("column_1 < 2", column_2="a").column_2 == "a"
 
-    # Order by statements shoud be respected when iterating over the relation
+def test_relation_order(table_relation):
+    """Order by statements shoud be respected when iterating over the relation."""
     assert tuple(table_relation.order("column_1 desc")) == (
         {"column_1": 3, "column_2": "c"},
         {"column_1": 2, "column_2": "b"},
         {"column_1": 1, "column_2": "a"},
     )
 
-    # The plus operator acts as a union all
-    assert (
-        db.to_relation(table_df[:1])
-        + db.to_relation(table_df[1:2])
-        + db.to_relation(table_df[2:])
-    ) == db.to_relation(table_df)
+
+def test_relation_union_all(db, table_df):
+    """The plus operator acts as a union all."""
+    df_relation = db.to_relation(table_df)
 
     # The union all must *not* remove duplicates
-    assert db.to_relation(table_df) + db.to_relation(table_df) != db.to_relation(
-        table_df
-    )
-    assert db.to_relation(table_df) + db.to_relation(table_df) == db.to_relation(
-        pl.concat([table_df, table_df])
+    assert df_relation + df_relation != df_relation
+    assert_all_equal(
+        db,
+        [
+            (
+                db.to_relation(table_df[:1])
+                + db.to_relation(table_df[1:2])
+                + db.to_relation(table_df[2:]),
+                df_relation,
+            ),
+            (
+                df_relation + df_relation,
+                db.to_relation(pl.concat([table_df, table_df])),
+            ),
+        ],
     )
 
-    # You should be able to subscript columns
-    assert table_relation["column_1"] == table_relation.select("column_1")
-    assert table_relation[["column_1", "column_2"]] == table_relation
 
-    # The relation's columns can be retrieved
+def test_relation_columns(table_relation):
+    """The columns of a relation can be retrieved and manipulated."""
     assert table_relation.columns == ["column_1", "column_2"]
 
     # You should be able to prefix and suffix all columns of a relation
@@ -125,14 +226,24 @@ def test_relation():
     ):
         table_relation.rename(a="new_name")
 
-    # Null values should be correctly handled
+
+def test_relation_null_values(db):
+    """Null values should be correctly handled."""
     none_df = pl.DataFrame({"column_1": [1, None]})
     none_relation = db.to_relation(none_df)
-    assert none_relation.filter("column_1 is null") == none_df.filter(
-        pl.col("column_1").is_null()
+    assert_all_equal(
+        db,
+        [
+            (
+                none_relation.filter("column_1 is null"),
+                none_df.filter(pl.col("column_1").is_null()),
+            )
+        ],
     )
 
-    # The .inner_join() method should work as INNER JOIN, not LEFT or OUTER JOIN
+
+def test_relation_joins(db):
+    """Test for Relation.inner_join() and Relation.left_join()."""
     left_relation = db.to_relation(
         pl.DataFrame(
             {
@@ -155,15 +266,6 @@ def test_relation():
             "right_primary_key": [10],
         }
     )
-    assert (
-        left_relation.set_alias("l").inner_join(
-            right_relation.set_alias("r"),
-            on="l.left_foreign_key = r.right_primary_key",
-        )
-        == joined_table
-    )
-
-    # But the .left_join() method performs a LEFT JOIN
     left_joined_table = pl.DataFrame(
         {
             "left_primary_key": [1, 2],
@@ -171,12 +273,26 @@ def test_relation():
             "right_primary_key": [10, None],
         }
     )
-    assert (
-        left_relation.set_alias("l").left_join(
-            right_relation.set_alias("r"),
-            on="l.left_foreign_key = r.right_primary_key",
-        )
-        == left_joined_table
+    assert_all_equal(
+        db,
+        [
+            # The .inner_join() method should work as INNER JOIN, not LEFT or OUTER
+            (
+                left_relation.set_alias("l").inner_join(
+                    right_relation.set_alias("r"),
+                    on="l.left_foreign_key = r.right_primary_key",
+                ),
+                joined_table,
+            ),
+            # But the .left_join() method performs a LEFT JOIN
+            (
+                left_relation.set_alias("l").left_join(
+                    right_relation.set_alias("r"),
+                    on="l.left_foreign_key = r.right_primary_key",
+                ),
+                left_joined_table,
+            ),
+        ],
     )
 
 
@@ -267,9 +383,8 @@ def test_relation_with_default_database():
     assert joined_relation.to_df().frame_equal(pl.DataFrame({"a": [1], "b": [1]}))
 
 
-def test_with_columns():
+def test_with_columns(db):
     """It should be able to crate new additional columns."""
-    db = pt.Database()
     relation = db.to_relation("select 1 as a, 2 as b")
 
     # We can define a new column
@@ -283,18 +398,16 @@ def test_with_columns():
     assert overwritten_relation.to_df().frame_equal(correct_overwritten)
 
 
-def test_rename_to_existing_column():
+def test_rename_to_existing_column(db):
     """Renaming a column to overwrite another should work."""
-    db = pt.Database()
     relation = db.to_relation("select 1 as a, 2 as b")
     renamed_relation = relation.rename(b="a")
     assert renamed_relation.columns == ["a"]
     assert renamed_relation.get().a == 2
 
 
-def test_add_suffix():
+def test_add_suffix(db):
     """It should be able to add suffixes to all column names."""
-    db = pt.Database()
     relation = db.to_relation("select 1 as a, 2 as b")
     assert relation.add_suffix("x").columns == ["ax", "bx"]
     assert relation.add_suffix("x", exclude=["a"]).columns == ["a", "bx"]
@@ -307,9 +420,8 @@ def test_add_suffix():
         relation.add_suffix("x", exclude=["a"], include=["b"])
 
 
-def test_add_prefix():
+def test_add_prefix(db):
     """It should be able to add prefixes to all column names."""
-    db = pt.Database()
     relation = db.to_relation("select 1 as a, 2 as b")
     assert relation.add_prefix("x").columns == ["xa", "xb"]
     assert relation.add_prefix("x", exclude=["a"]).columns == ["a", "xb"]
@@ -322,9 +434,8 @@ def test_add_prefix():
         relation.add_prefix("x", exclude=["a"], include=["b"])
 
 
-def test_relation_aggregate_method():
+def test_relation_aggregate_method(db):
     """Test for Relation.aggregate()."""
-    db = pt.Database()
     relation = db.to_relation(
         pl.DataFrame(
             {
@@ -357,9 +468,8 @@ def test_relation_aggregate_method():
     )
 
 
-def test_relation_all_method():
+def test_relation_all_method(db):
     """Test for Relation.all()."""
-    db = pt.Database()
     relation = db.to_relation(
         pl.DataFrame(
             {
@@ -374,9 +484,7 @@ def test_relation_all_method():
     assert relation.all("a < 4", b=100)
 
 
-def test_relation_case_method():
-    db = pt.Database()
-
+def test_relation_case_method(db):
     df = pl.DataFrame(
         {
             "shelf_classification": ["A", "B", "A", "C", "D"],
@@ -395,7 +503,6 @@ def test_relation_case_method():
         mapping={"A": 10, "B": 20, "D": None},
         default=0,
     )
-    assert mapped_actions == correct_mapped_actions
 
     # We can also use the Case class
     case_statement = pt.sql.Case(
@@ -404,16 +511,26 @@ def test_relation_case_method():
         default=0,
     )
     alt_mapped_actions = db.to_relation(df).select(f"*, {case_statement} as max_weight")
-    assert alt_mapped_actions == correct_mapped_actions
+    assert_all_equal(
+        db,
+        [
+            (mapped_actions, correct_mapped_actions),
+            (alt_mapped_actions, correct_mapped_actions),
+        ],
+    )
 
 
-def test_relation_coalesce_method():
+def test_relation_coalesce_method(db):
     """Test for Relation.coalesce()."""
-    db = pt.Database()
-    df = pl.DataFrame(
-        {"column_1": [1.0, None], "column_2": [None, "2"], "column_3": [3.0, None]}
+    relation = db.to_relation(
+        pl.DataFrame(
+            {
+                "column_1": [1.0, None],
+                "column_2": [None, "2"],
+                "column_3": [3.0, None],
+            }
+        )
     )
-    relation = db.to_relation(df)
     coalesce_result = relation.coalesce(column_1=10, column_2="20").to_df()
     correct_coalesce_result = pl.DataFrame(
         {
@@ -425,22 +542,25 @@ def test_relation_coalesce_method():
     assert coalesce_result.frame_equal(correct_coalesce_result)
 
 
-def test_relation_union_method():
+def test_relation_union_method(db):
     """Test for Relation.union and Relation.__add__."""
-    db = pt.Database()
     left = db.to_relation("select 1 as a, 2 as b")
     right = db.to_relation("select 200 as b, 100 as a")
     correct_union = pl.DataFrame(
-        {
-            "a": [1, 100],
-            "b": [2, 200],
-        }
+        [
+            pl.Series("a", [1, 100], dtype=pl.Int32),
+            pl.Series("b", [2, 200], dtype=pl.Int32),
+        ]
+    )
+    assert_all_equal(
+        db,
+        [
+            (left + right, correct_union),
+            (right + left, correct_union[["b", "a"]][::-1]),
+            (left.union(right), correct_union),
+            (right.union(left), correct_union[["b", "a"]][::-1]),
+        ],
     )
-    assert left + right == correct_union
-    assert right + left == correct_union[["b", "a"]][::-1]
-
-    assert left.union(right) == correct_union
-    assert right.union(left) == correct_union[["b", "a"]][::-1]
 
     incompatible = db.to_relation("select 1 as a")
     with pytest.raises(
@@ -455,10 +575,8 @@ def test_relation_union_method():
         left + incompatible  # pyright: ignore
 
 
-def test_relation_model_functionality():
+def test_relation_model_functionality(db):
     """The end-user should be able to specify the constructor for row values."""
-    db = pt.Database()
-
     # We have two rows in our relation
     first_row_relation = db.to_relation("select 1 as a, 2 as b")
     second_row_relation = db.to_relation("select 3 as a, 4 as b")
@@ -474,10 +592,15 @@ def test_relation_model_functionality():
     assert get_value.b == 2
 
     # The end-user should be able to specify a custom row constructor
-    model_mock = MagicMock(return_value="mock_return")
+    calls = []
+
+    def model_mock(**kwargs):
+        calls.append(kwargs)
+        return "mock_return"
+
     new_relation = relation.set_model(model_mock)
     assert new_relation.get("a = 1") == "mock_return"
-    model_mock.assert_called_with(a=1, b=2)
+    assert calls[-1] == {"a": 1, "b": 2}
 
     # We create a custom model
     class MyModel(pt.Model):
@@ -519,6 +642,7 @@ def test_relation_model_functionality():
 
 def test_row_sql_type_functionality():
     """Tests for mapping pydantic types to DuckDB SQL types."""
+
     # Two nullable and two non-nullable columns
     class OptionalRow(pt.Model):
         a: str
@@ -544,7 +668,7 @@ def test_row_sql_type_functionality():
     }
 
 
-def test_fill_missing_columns():
+def test_fill_missing_columns(db):
     """Tests for Relation.with_missing_{nullable,defaultable}_columns."""
 
     class MyRow(pt.Model):
@@ -562,7 +686,6 @@ def test_fill_missing_columns():
     # We check if defaults are easily retrievable from the model
     assert MyRow.defaults == {"b": "default_value"}
 
-    db = pt.Database()
     df = pl.DataFrame({"a": ["mandatory"], "d": [10.5]})
     relation = db.to_relation(df).set_model(MyRow)
 
@@ -731,19 +854,19 @@ def test_with_missing_defualtable_enum_columns():
     assert model_relation.types["enum_column"].startswith("enum__")
 
 
-def test_relation_insert_into():
+def test_relation_insert_into(db):
     """Relation.insert_into() should automatically order columnns correctly."""
-    db = pt.Database()
+    table_name = unique_name("foo")
     db.execute(
-        """
-        create table foo (
+        f"""
+        create table {table_name} (
             a integer,
             b integer
         )
     """
     )
-    db.to_relation("select 2 as b, 1 as a").insert_into(table="foo")
-    row = db.table("foo").get()
+    db.to_relation("select 2 as b, 1 as a").insert_into(table=table_name)
+    row = db.table(table_name).get()
     assert row.a == 1
     assert row.b == 2
 
@@ -751,18 +874,17 @@ def test_relation_insert_into():
         TypeError,
         match=re.escape(
             "Relation is missing column(s) {'a'} "
-            "in order to be inserted into table 'foo'!"
+            f"in order to be inserted into table '{table_name}'!"
         ),
     ):
-        db.to_relation("select 2 as b, 1 as c").insert_into(table="foo")
+        db.to_relation("select 2 as b, 1 as c").insert_into(table=table_name)
 
 
-def test_polars_support():
+def test_polars_support(db):
     # Test converting a polars DataFrame to patito relation
     df = pl.DataFrame(data={"column_1": ["a", "b", None], "column_2": [1, 2, None]})
     correct_dtypes = [pl.Utf8, pl.Int64]
     assert df.dtypes == correct_dtypes
-    db = pt.Database()
     relation = db.to_relation(df)
     assert relation.get(column_1="a").column_2 == 1
 
@@ -816,9 +938,8 @@ def test_polars_support():
     assert unvalidated_model.b == 2
 
 
-def test_series_vs_dataframe_behavior():
+def test_series_vs_dataframe_behavior(db):
     """Test Relation.to_series()."""
-    db = pt.Database()
     relation = db.to_relation("select 1 as column_1, 2 as column_2")
 
     # Selecting multiple columns should yield a DataFrame
@@ -893,18 +1014,16 @@ def test_non_string_enum():
     assert enum_df.dtypes == [pl.Int64]
 
 
-def test_multiple_filters():
+def test_multiple_filters(db):
     """The filter method should AND multiple filters properly."""
-    db = pt.Database()
     relation = db.to_relation("select 1 as a, 2 as b")
     # The logical or should not make the filter valid for our row
     assert relation.filter("(1 = 2) or b = 2", a=0).count() == 0
     assert relation.filter("a=0", "(1 = 2) or b = 2").count() == 0
 
 
-def test_no_filter():
+def test_no_filter(db):
     """No filters should return all rows."""
-    db = pt.Database()
     relation = db.to_relation("select 1 as a, 2 as b")
     # The logical or should not make the filter valid for our row
     assert relation.filter().count()
@@ -1,4 +1,5 @@
 """Tests for patito.Model."""
+
 # pyright: reportPrivateImportUsage=false
 import enum
 import re
@@ -427,4 +428,4 @@ def test_enum_annotated_field():
     if pt._DUCKDB_AVAILABLE:
         assert EnumModel.sql_types["column"].startswith("enum__")
         with pytest.raises(TypeError, match=r".*Encountered types: \['int', 'str'\]\."):
-            InvalidEnumModel.sql_types
+            InvalidEnumModel.sql_types  # noqa: B018
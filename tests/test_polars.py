@@ -1,4 +1,5 @@
 """Tests related to polars functionality."""
+
 import re
 from datetime import date, datetime
 
@@ -1,4 +1,5 @@
 """Tests for the patito.validators module."""
+
 import enum
 import sys
 from datetime import date, datetime
@@ -132,6 +133,7 @@ def test_validate_non_nullable_columns():
 
 def test_validate_dtype_checks():
     """Test dtype-checking logic."""
+
     # An integer field may be validated against several different integer dtypes
     class IntModel(pt.Model):
         column: int
@@ -208,7 +210,7 @@ def test_validate_dtype_checks():
         NotImplementedError,
         match="No valid dtype mapping found for column 'my_field'.",
     ):
-        NonCompatibleModel.valid_dtypes
+        NonCompatibleModel.valid_dtypes  # noqa: B018
 
     # The same goes for list-annotated fields
     class NonCompatibleListModel(pt.Model):
@@ -218,7 +220,7 @@ def test_validate_dtype_checks():
         NotImplementedError,
         match="No valid dtype mapping found for column 'my_field'.",
     ):
-        NonCompatibleListModel.valid_dtypes
+        NonCompatibleListModel.valid_dtypes  # noqa: B018
 
     # It should also work with pandas data frames
     class PandasCompatibleModel(CompleteModel):